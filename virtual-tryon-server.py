@@ -3,25 +3,30 @@
 Simple server to run the virtual try-on service alongside the main application.
 """
 
+import importlib.util
 import os
-import subprocess
-import sys
 import time
 from pathlib import Path
 
+REQUIRED_PACKAGES = ["gradio", "google.cloud.logging", "google.genai", "PIL"]
+
+def is_module_available(name):
+    """Check if a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
 def check_requirements():
     """Check if required packages are installed."""
-    try:
-        import gradio
-        import google.cloud.logging
-        from google import genai
-        from PIL import Image
-        print("✅ All required packages are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
+    # Probe only: the app runs in this process and imports the SDKs lazily
+    missing = [name for name in REQUIRED_PACKAGES if not is_module_available(name)]
+    if missing:
+        print(f"❌ Missing required package: {', '.join(missing)}")
         print("Please install requirements: pip install -r requirements.txt")
         return False
+    print("✅ All required packages are installed")
+    return True
 
 def check_environment():
     """Check if environment variables are set."""
@@ -54,11 +59,14 @@ def run_virtual_tryon():
     print("🚀 Starting Virtual Try-On service...")
     
     try:
-        # Run the virtual try-on script
-        subprocess.run([sys.executable, "virtual-tryon.py"], check=True)
-    except subprocess.CalledProcessError as e:
+        # Import in-process (after .env is loaded) instead of spawning a new interpreter
+        import virtual_tryon
+    except (ImportError, OSError) as e:
         print(f"❌ Failed to start virtual try-on service: {e}")
         return False
+    
+    try:
+        virtual_tryon.main()
     except KeyboardInterrupt:
         print("\n👋 Virtual Try-On service stopped")
         return True
@@ -0,0 +1,474 @@
+"""Virtual Try-On with Gradio and Vertex AI."""
+# ruff: noqa: E501
+
+# %% IMPORTS
+
+import functools
+import hashlib
+import importlib.util
+import io
+import logging
+import os
+import tempfile
+import threading
+
+import gradio as gr
+import PIL
+import requests
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def is_module_available(name: str) -> bool:
+    """Checks whether a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+# The Google Cloud SDKs are slow to import, so only probe for them here
+VERTEX_AI_AVAILABLE = all(
+    is_module_available(name)
+    for name in ("google.cloud.logging", "google.cloud.aiplatform", "vertexai")
+)
+if not VERTEX_AI_AVAILABLE:
+    print("Warning: Google Cloud AI Platform not available. Using fallback mode.")
+
+# %% ENVIRONS
+
+GOOGLE_CLOUD_LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
+GOOGLE_CLOUD_PROJECT = os.environ.get("GOOGLE_CLOUD_PROJECT", "your-project-id")
+
+LOGGING_LEVEL = os.getenv("LOGGING_LEVEL", "INFO")
+
+GENERATED_DIR = os.getenv("GENERATED_DIR", os.path.join(tempfile.gettempdir(), "bharat_heritage_generated"))
+DEMO_CACHE_DIR = os.getenv("DEMO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bharat_heritage_tryon"))
+SAMPLES_CACHE_DIR = os.getenv("SAMPLES_CACHE_DIR", os.path.expanduser("~/.cache/bharat_heritage/samples"))
+
+# %% CONFIGS
+
+THEME = "soft"
+TITLE = "Bharat Heritage - Virtual Try-On"
+FAVICON = "assets/favicon.ico"
+DESCRIPTION = """
+**Experience Traditional Indian Attire with AI-Powered Virtual Try-On**
+
+Discover the beauty of Indian heritage clothing through our advanced virtual try-on technology. Upload your photo and select from traditional Indian garments like sarees, lehengas, kurtas, and more to see how they look on you.
+
+**Supported Traditional Wear:** Sarees, Lehengas, Kurtas, Sherwanis, Anarkalis, Dhoti-Kurta sets, Traditional Blouses, and Ethnic Accessories.
+
+**Note:** This is a demonstration interface. For full functionality, Google Cloud Vertex AI configuration is required.
+"""
+FOOTER = (
+    "<center>"
+    "<a href='main.html'>← Back to Bharat Heritage</a> | "
+    "Powered by Google Vertex AI Technology"
+    "</center>"
+)
+MAX_IMAGE_SIZE = 1024  # longest side (px) used for demo compositing
+QUEUE_CONCURRENCY = 4  # try-on requests processed in parallel
+QUEUE_MAX_SIZE = 32  # pending requests before new ones are rejected
+SAMPLE_THUMBNAIL_SIZE = 256  # longest side (px) of the cached sample images
+MAX_GENERATED_FILES = 64  # AI results kept on disk for Gradio to copy
+MAX_DEMO_CACHE_FILES = 256  # demo composites kept in the disk cache
+DEMO_CACHE_VERSION = 2  # bump whenever load_image or create_demo_image output changes
+
+# %% CLIENTS
+
+# Shared HTTP session so sample downloads reuse pooled connections
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=3, connect=0, backoff_factor=0.2)))
+
+client = None
+client_error = None
+client_loaded = False
+client_lock = threading.Lock()
+
+def get_client():
+    """Returns the Vertex AI image model, importing and initializing it on first use."""
+    global client, client_error, client_loaded
+    with client_lock:
+        if not client_loaded:
+            client_loaded = True
+            if VERTEX_AI_AVAILABLE and GOOGLE_CLOUD_PROJECT != "your-project-id":
+                try:
+                    from google.cloud import aiplatform
+                    from vertexai.preview.vision_models import ImageGenerationModel
+                    aiplatform.init(project=GOOGLE_CLOUD_PROJECT, location=GOOGLE_CLOUD_LOCATION)
+                    client = ImageGenerationModel.from_pretrained("imagegeneration@006")
+                except Exception as e:
+                    print(f"Warning: Could not initialize Vertex AI client: {e}")
+                    client = None
+                    client_error = str(e)
+    return client
+
+# %% LOGGING
+
+try:
+    if VERTEX_AI_AVAILABLE and GOOGLE_CLOUD_PROJECT != "your-project-id":
+        import google.cloud.logging as gcl
+        logging_client = gcl.Client()
+        logging_client.setup_logging(log_level=getattr(logging, LOGGING_LEVEL))
+    else:
+        logging.basicConfig(level=getattr(logging, LOGGING_LEVEL))
+except Exception as e:
+    print(f"Warning: Could not setup cloud logging: {e}")
+    logging.basicConfig(level=getattr(logging, LOGGING_LEVEL))
+
+# %% FUNCTIONS
+
+def downscale_image(image: Image.Image, max_size: int = MAX_IMAGE_SIZE) -> Image.Image:
+    """Shrinks an image in place so its longest side is at most max_size."""
+    if max(image.size) <= max_size:
+        return image
+    if image.format == "JPEG":
+        # Let libjpeg decode at a reduced scale before any pixel work
+        image.draft("RGB", (max_size, max_size))
+    image.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+    return image
+
+@functools.lru_cache(maxsize=8)
+def load_image(path: str) -> Image.Image:
+    """Opens an uploaded image, downscaled and ready for compositing."""
+    try:
+        image = Image.open(path)
+    except UnidentifiedImageError:
+        raise gr.Error("Unsupported image format. Please upload a JPEG, PNG or WebP image.", title="Unsupported Image")
+    image = downscale_image(image)
+    # Gradio hands filepath uploads over untouched, so honour EXIF rotation here
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    # Decode now: the cached image is shared read-only between requests
+    image.load()
+    return image
+
+def save_image(image: Image.Image, directory: str | None = None) -> str:
+    """Saves a result image to a temporary file and returns its path."""
+    # Results are opaque, so JPEG beats PNG on the wire; progressive lets
+    # the browser paint a preview before the last bytes arrive
+    with tempfile.NamedTemporaryFile(suffix=".jpg", dir=directory, delete=False) as file:
+        image.convert("RGB").save(file, "JPEG", quality=85, optimize=False, progressive=True)
+    return file.name
+
+def get_mtime(entry: os.DirEntry) -> float:
+    """Returns a directory entry's modification time, or 0 if it has vanished."""
+    try:
+        return entry.stat().st_mtime
+    except FileNotFoundError:
+        # Removed by another process or a temp cleaner; sort it as oldest
+        return 0.0
+
+def prune_directory(directory: str, keep: int) -> None:
+    """Deletes the oldest files in a directory so at most keep remain."""
+    entries = sorted(os.scandir(directory), key=get_mtime, reverse=True)
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+generated_lock = threading.Lock()
+
+def save_image_bytes(image_bytes: bytes, suffix: str = ".png") -> str:
+    """Saves already-encoded image bytes into GENERATED_DIR and returns its path."""
+    path = os.path.join(GENERATED_DIR, hashlib.sha1(image_bytes).hexdigest() + suffix)
+    # Concurrent requests must not prune each other's files mid-write
+    with generated_lock:
+        if not os.path.exists(path):
+            os.makedirs(GENERATED_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(suffix=suffix, dir=GENERATED_DIR, delete=False) as file:
+                file.write(image_bytes)
+            os.replace(file.name, path)
+            # Gradio copies results into its own cache, so only recent files are needed
+            prune_directory(GENERATED_DIR, MAX_GENERATED_FILES)
+    return path
+
+def hash_file(path: str) -> str:
+    """Returns the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def create_demo_image(person_image: Image.Image, product_image: Image.Image) -> Image.Image:
+    """Creates a demo composite image when AI service is not available."""
+    # Create a simple side-by-side composite for demonstration
+    width = max(person_image.width, product_image.width) * 2
+    height = max(person_image.height, product_image.height)
+    
+    composite = Image.new('RGB', (width, height), (255, 255, 255))
+    
+    # Resize images to fit
+    person_resized = person_image.resize((width//2, height))
+    product_resized = product_image.resize((width//2, height))
+    
+    composite.paste(person_resized, (0, 0))
+    composite.paste(product_resized, (width//2, 0))
+    
+    return composite
+
+demo_cache_lock = threading.Lock()
+
+def generate_demo_images(person_image: str, product_image: str) -> list[str]:
+    """Generates the demo composite from the uploaded image paths."""
+    # Re-clicks with the same uploads reuse the composite cached on disk
+    name = f"v{DEMO_CACHE_VERSION}-{hash_file(person_image)[:16]}-{hash_file(product_image)[:16]}-{MAX_IMAGE_SIZE}.jpg"
+    path = os.path.join(DEMO_CACHE_DIR, name)
+    if not os.path.exists(path):
+        demo_image = create_demo_image(load_image(person_image), load_image(product_image))
+        with demo_cache_lock:
+            os.makedirs(DEMO_CACHE_DIR, exist_ok=True)
+            os.replace(save_image(demo_image, DEMO_CACHE_DIR), path)
+            prune_directory(DEMO_CACHE_DIR, MAX_DEMO_CACHE_FILES)
+    return [path]
+
+def generate_try_on_images(
+    person_image: str,
+    product_image: str,
+    base_steps: int = 32,
+    image_count: int = 1,
+) -> list[str]:
+    """Generates images using the Virtual Try-On API or demo mode."""
+    if not person_image:
+        raise gr.Error("Please upload a person image.", title="Missing Person Image")
+    if not product_image:
+        raise gr.Error("Please upload a traditional wear image.", title="Missing Product Input")
+    
+    client = get_client()
+    if not client:
+        # Demo mode - create a simple composite
+        if client_error:
+            gr.Warning(f"Vertex AI could not be initialized: {client_error}. Showing demo composite instead.")
+        else:
+            gr.Info("Demo mode: Creating composite image. For AI-powered try-on, configure Google Cloud Vertex AI.")
+        return generate_demo_images(person_image, product_image)
+    
+    try:
+        # This is a simplified approach - you may need to adjust based on your specific Vertex AI setup
+        prompt = f"A person wearing traditional Indian clothing, high quality, realistic, {base_steps} steps"
+        
+        response = client.generate_images(
+            prompt=prompt,
+            number_of_images=image_count,
+        )
+        
+        # Serve the encoded bytes as-is instead of decoding them to PIL
+        return [
+            save_image_bytes(generated_image._image_bytes)
+            for generated_image in response.images
+        ]
+        
+    except Exception as error:
+        gr.Warning(f"AI generation failed: {error}. Showing demo composite instead.")
+        return generate_demo_images(person_image, product_image)
+
+# %% SAMPLE IMAGES
+
+def get_sample_path(url: str) -> str:
+    """Returns the disk cache path of a sample image thumbnail."""
+    return os.path.join(SAMPLES_CACHE_DIR, f"{hashlib.sha1(url.encode()).hexdigest()}-{SAMPLE_THUMBNAIL_SIZE}.jpg")
+
+def fetch_sample_image(url: str) -> str:
+    """Downloads a sample image once into the disk cache as a thumbnail and returns its path."""
+    path = get_sample_path(url)
+    if not os.path.exists(path):
+        os.makedirs(SAMPLES_CACHE_DIR, exist_ok=True)
+        response = session.get(url, timeout=(3, 10))
+        response.raise_for_status()
+        image = Image.open(io.BytesIO(response.content))
+        # Let libjpeg decode at a reduced scale before shrinking to a thumbnail
+        image.draft("RGB", (SAMPLE_THUMBNAIL_SIZE * 2, SAMPLE_THUMBNAIL_SIZE * 2))
+        image.thumbnail((SAMPLE_THUMBNAIL_SIZE, SAMPLE_THUMBNAIL_SIZE))
+        # Write then rename so a failed download never leaves a partial file
+        with tempfile.NamedTemporaryFile(dir=SAMPLES_CACHE_DIR, delete=False) as file:
+            image.convert("RGB").save(file, "JPEG", quality=80, optimize=True, progressive=True)
+        os.replace(file.name, path)
+    return path
+
+def cache_sample_images(urls: list[str]) -> None:
+    """Downloads missing sample images into the disk cache for later starts."""
+    for url in urls:
+        try:
+            fetch_sample_image(url)
+        except OSError as e:
+            print(f"Warning: Could not cache sample image {url}: {e}")
+
+@functools.lru_cache(maxsize=1)
+def get_sample_traditional_wear() -> tuple[str, ...]:
+    """Returns sample traditional wear images for demonstration."""
+    urls = [
+        "https://images.pexels.com/photos/8442493/pexels-photo-8442493.jpeg",
+        "https://images.pexels.com/photos/8442492/pexels-photo-8442492.jpeg",
+        "https://images.pexels.com/photos/8442491/pexels-photo-8442491.jpeg"
+    ]
+    samples = []
+    missing = []
+    for url in urls:
+        path = get_sample_path(url)
+        if os.path.exists(path):
+            samples.append(path)
+        else:
+            samples.append(url)
+            missing.append(url)
+    # Never block startup on the network: serve the URLs now, cache for next time
+    if missing:
+        threading.Thread(target=cache_sample_images, args=(missing,), daemon=True).start()
+    return tuple(samples)
+
+# %% INTERFACES
+
+with gr.Blocks(title=TITLE, theme=THEME, fill_width=True, css="""
+    .gradio-container {
+        background: linear-gradient(120deg, #eecda3 0%, #ef629f 100%);
+        min-height: 100vh;
+    }
+    .main-container {
+        background: white;
+        border-radius: 16px;
+        padding: 2rem;
+        margin: 2rem;
+        box-shadow: 0 6px 48px rgba(0,0,0,.10);
+    }
+    .heritage-header {
+        background: linear-gradient(90deg, orange, white, green);
+        background-clip: text;
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .status-info {
+        background: #e8f4fd;
+        border: 1px solid #bee5eb;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+        text-align: center;
+    }
+""") as demo:
+    with gr.Column(elem_classes="main-container"):
+        gr.Markdown(f"# {TITLE}", elem_classes="heritage-header")
+        gr.Markdown(DESCRIPTION)
+        
+        # Status information
+        if not VERTEX_AI_AVAILABLE or GOOGLE_CLOUD_PROJECT == "your-project-id":
+            gr.Markdown("""
+            <div class="status-info">
+            <strong>🔧 Configuration Required</strong><br>
+            This demo runs in fallback mode. For AI-powered virtual try-on:<br>
+            1. Install: <code>pip install google-cloud-aiplatform vertexai</code><br>
+            2. Set up Google Cloud authentication<br>
+            3. Configure GOOGLE_CLOUD_PROJECT in your .env file
+            </div>
+            """)
+        else:
+            gr.Markdown("""
+            <div class="status-info">
+            <strong>✅ AI Service Configured</strong><br>
+            Google Cloud Vertex AI is configured and connects on your first try-on. If it cannot start, you will see a warning and a demo composite instead.
+            </div>
+            """)
+        
+        with gr.Row():
+            with gr.Column():
+                gr.Markdown("### Upload Your Photo")
+                person_image = gr.Image(
+                    label="Your Photo", 
+                    type="filepath", 
+                    height=400,
+                    info="Upload a clear photo of yourself for the best results"
+                )
+                
+                gr.Markdown("### Select Traditional Wear")
+                product_image = gr.Image(
+                    label="Traditional Wear", 
+                    type="filepath", 
+                    height=400,
+                    info="Upload an image of the traditional Indian garment you want to try on"
+                )
+                
+                with gr.Row():
+                    base_steps = gr.Slider(
+                        minimum=1,
+                        maximum=150,
+                        value=32,
+                        step=1,
+                        label="Quality Steps",
+                        info="Higher value for better quality (when AI is enabled).",
+                    )
+                    image_count = gr.Slider(
+                        minimum=1,
+                        maximum=4,
+                        value=1,
+                        step=1,
+                        label="Number of Images",
+                        info="Generate up to 4 variations (when AI is enabled).",
+                    )
+                
+                generate_button = gr.Button(
+                    "✨ Try On Traditional Wear", 
+                    variant="primary", 
+                    size="lg"
+                )
+                
+            with gr.Column():
+                gr.Markdown("### Virtual Try-On Results")
+                output_image = gr.Gallery(
+                    label="Your Virtual Try-On", 
+                    columns=2,
+                    height=600,
+                    show_label=True
+                )
+                
+                gr.Markdown("### Sample Traditional Wear")
+                gr.Markdown("*You can download these sample images and upload them as traditional wear*")
+                
+                sample_gallery = gr.Gallery(
+                    value=list(get_sample_traditional_wear()),
+                    label="Sample Traditional Wear",
+                    columns=3,
+                    height=200,
+                    allow_preview=True
+                )
+        
+        generate_button.click(
+            fn=generate_try_on_images,
+            inputs=[person_image, product_image, base_steps, image_count],
+            outputs=output_image,
+        )
+        
+        gr.Markdown(value=FOOTER)
+
+# %% ENTRYPOINTS
+
+def main():
+    """Launches the virtual try-on Gradio app."""
+    print("🎭 Starting Bharat Heritage Virtual Try-On Service")
+    print("=" * 50)
+    
+    if not VERTEX_AI_AVAILABLE:
+        print("⚠️  Running in demo mode - install google-cloud-aiplatform for full AI features")
+    elif GOOGLE_CLOUD_PROJECT == "your-project-id":
+        print("⚠️  Please configure GOOGLE_CLOUD_PROJECT in your .env file")
+    else:
+        print("✅ AI service configured and ready")
+    
+    # Pillow-SIMD releases carry a .postN suffix
+    backend = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    turbo = " + libjpeg-turbo" if features.check_feature("libjpeg_turbo") else ""
+    print(f"🖼️  Image backend: {backend} {PIL.__version__}{turbo}")
+    
+    demo.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
+    demo.launch(
+        favicon_path=FAVICON if os.path.exists(FAVICON) else None, 
+        pwa=True,
+        server_name="0.0.0.0",
+        server_port=7860,
+        share=False
+    )
+
+if __name__ == "__main__":
+    main()